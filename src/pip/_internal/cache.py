@@ -95,12 +95,13 @@ class Cache:
         if not self.allowed_formats.intersection(formats):
             return []
 
-        candidates = []
         path = self.get_path_for_link(link)
-        if os.path.isdir(path):
-            for candidate in os.listdir(path):
-                candidates.append((candidate, path))
-        return candidates
+        # Most links have no cache entry, so try listing directly instead of
+        # paying for an extra stat() on every lookup.
+        try:
+            return [(candidate, path) for candidate in os.listdir(path)]
+        except OSError:
+            return []
 
     def get_path_for_link(self, link: Link) -> str:
         """Return a directory to store cached items in for link."""
@@ -41,6 +41,7 @@ class Link(KeyBasedCompareMixin):
 
     __slots__ = [
         "_parsed_url",
+        "_path",
         "_url",
         "_hashes",
         "comes_from",
@@ -86,6 +87,9 @@ class Link(KeyBasedCompareMixin):
             url = path_to_url(url)
 
         self._parsed_url = urllib.parse.urlsplit(url)
+        # The unquoted path backs filename, splitext() and friends, which are
+        # queried repeatedly for every candidate link, so only compute it once.
+        self._path = urllib.parse.unquote(self._parsed_url.path)
         # Store the url as a private attribute to prevent accidentally
         # trying to set a new value.
         self._url = url
@@ -109,7 +113,7 @@ class Link(KeyBasedCompareMixin):
                 redact_auth_from_url(self._url), self.comes_from, rp
             )
         else:
-            return redact_auth_from_url(str(self._url))
+            return redact_auth_from_url(self._url)
 
     def __repr__(self) -> str:
         return f"<Link {self}>"
@@ -149,7 +153,7 @@ class Link(KeyBasedCompareMixin):
 
     @property
     def path(self) -> str:
-        return urllib.parse.unquote(self._parsed_url.path)
+        return self._path
 
     def splitext(self) -> Tuple[str, str]:
         return splitext(posixpath.basename(self.path.rstrip("/")))
@@ -43,6 +43,16 @@ def test_wheel_name_filter(tmpdir: Path) -> None:
     assert wc.get(link, "package2", [Tag("py3", "none", "any")]) is link
 
 
+def test_get_missing_cache_dir(tmpdir: Path) -> None:
+    """
+    Test the original link is returned when nothing was cached for it.
+    """
+    wc = WheelCache(os.fspath(tmpdir), FormatControl())
+    link = Link("https://g.c/package.tar.gz")
+    assert not os.path.exists(wc.get_path_for_link(link))
+    assert wc.get(link, "package", [Tag("py3", "none", "any")]) is link
+
+
 def test_cache_hash() -> None:
     h = _hash_dict({"url": "https://g.c/o/r"})
     assert h == "72aa79d3315c181d2cc23239d7109a782de663b6f89982624d8c1e86"
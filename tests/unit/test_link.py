@@ -48,6 +48,10 @@ class TestLink:
         link = Link(url)
         assert link.filename == expected
 
+    def test_path(self) -> None:
+        link = Link("https://example.com/path/page%231.html?a=b#frag")
+        assert link.path == "/path/page#1.html"
+
     def test_splitext(self) -> None:
         assert ("wheel", ".whl") == Link("http://yo/wheel.whl").splitext()
 
@@ -1,6 +1,7 @@
 import logging
 import sys
 from typing import Dict
+from unittest import mock
 
 import pytest
 
@@ -71,6 +72,39 @@ def test_prepare_download__log(
     assert expected in record.message
 
 
+def test_prepare_download__progress_bar_off(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    resp = MockResponse(b"")
+    resp.url = "http://example.com/foo.tgz"
+    resp.headers = {"content-length": "100000"}
+    link = Link(resp.url)
+    with mock.patch(
+        "pip._internal.network.download.get_download_progress_renderer"
+    ) as renderer:
+        _prepare_download(resp, link, progress_bar="off")
+
+    renderer.assert_not_called()
+    assert len(caplog.records) == 1
+    assert "Downloading http://example.com/foo.tgz" in caplog.records[0].message
+
+
+def test_prepare_download__no_progress_above_info(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.WARNING)
+    resp = MockResponse(b"")
+    resp.url = "http://example.com/foo.tgz"
+    resp.headers = {"content-length": "100000"}
+    link = Link(resp.url)
+    with mock.patch(
+        "pip._internal.network.download.get_download_progress_renderer"
+    ) as renderer:
+        _prepare_download(resp, link, progress_bar="on")
+
+    renderer.assert_not_called()
+    assert not caplog.records
+
+
 @pytest.mark.parametrize(
     "filename, expected",
     [